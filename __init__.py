@@ -3,8 +3,9 @@ from __future__ import annotations
 
 import logging
 import asyncio
+import bisect
 from datetime import datetime, time
-from typing import Any, Dict
+from typing import Any, Dict, Final
 
 import voluptuous as vol
 
@@ -12,15 +13,22 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     EVENT_HOMEASSISTANT_START,
-    EVENT_STATE_CHANGED,
     STATE_ON,
     STATE_OFF,
     Platform,
 )
-from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    State,
+    callback,
+)
 from homeassistant.helpers import entity_registry
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_time_interval,
     async_track_state_change_event,
 )
@@ -52,16 +60,18 @@ from .const import (
     EVENT_TIME_SLOT_ADDED,
     EVENT_TIME_SLOT_REMOVED,
     SCAN_INTERVAL,
+    RESTORE_DEBOUNCE_DELAY,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-TIME_SLOT_SERVICE_SCHEMA = vol.Schema({
+# Compiled once at import and shared by every manager's service registrations
+TIME_SLOT_SERVICE_SCHEMA: Final = vol.Schema({
     vol.Required(CONF_START_TIME): str,
     vol.Required(CONF_END_TIME): str,
 })
 
-ENABLE_DISABLE_SERVICE_SCHEMA = vol.Schema({
+ENABLE_DISABLE_SERVICE_SCHEMA: Final = vol.Schema({
     vol.Optional(CONF_AREA): str,
 })
 
@@ -92,9 +102,29 @@ class LightStateRestorationManager:
         self.entry = entry
         self._area = entry.data[CONF_AREA]
         self._enabled = True
-        self._motion_active: Dict[str, bool] = {}
+        self._lights: tuple[str, ...] = ()
+        self._lights_payload: dict[str, Any] = {}
+        self._motion_sensors: tuple[str, ...] = tuple(
+            entry.data[CONF_MOTION_SENSORS]
+        )
+        self._illuminance_sensors: tuple[str, ...] = ()
+        self._illuminance_threshold = DEFAULT_ILLUMINANCE_THRESHOLD
+        self._delay = DEFAULT_DELAY
+        self._last_illuminance_check: tuple[datetime | None, ...] | None = None
+        self._last_illuminance_result = True
+        self._lux_cache: Dict[str, tuple[datetime, float]] = {}
+        self._slot_starts: list[time] = []
+        self._slot_ends: list[time] = []
+        self._load_config()
+        self._motion_index: Dict[str, int] = {
+            sensor_id: index
+            for index, sensor_id in enumerate(self._motion_sensors)
+        }
+        self._motion_mask = 0
         self._restore_timers: Dict[str, asyncio.Task] = {}
+        self._restore_pending: CALLBACK_TYPE | None = None
         self._cancel_scan_interval = None
+        self._unsub_motion = None
 
     async def async_setup(self) -> None:
         """Set up the manager."""
@@ -124,80 +154,189 @@ class LightStateRestorationManager:
             schema=ENABLE_DISABLE_SERVICE_SCHEMA,
         )
 
-        # Set up motion sensor monitoring
-        for sensor_id in self.entry.data[CONF_MOTION_SENSORS]:
-            self._motion_active[sensor_id] = False
+        # Set up motion sensor monitoring, seeded from the current states
+        for sensor_id, index in self._motion_index.items():
+            state = self.hass.states.get(sensor_id)
+            if state is not None and state.state == STATE_ON:
+                self._motion_mask |= 1 << index
+        self._maybe_start_scan()
 
         @callback
         def handle_motion(event: Event) -> None:
             """Handle motion sensor state changes."""
             entity_id = event.data["entity_id"]
-            if entity_id not in self._motion_active:
-                return
-
             new_state = event.data["new_state"]
             if new_state is None:
                 return
 
-            self._motion_active[entity_id] = new_state.state == STATE_ON
-            self._handle_motion_change(entity_id)
+            bit = 1 << self._motion_index[entity_id]
+            is_on = new_state.state == STATE_ON
+            # Ignore attribute-only changes and repeated states
+            if bool(self._motion_mask & bit) == is_on:
+                return
 
-        self.hass.bus.async_listen(EVENT_STATE_CHANGED, handle_motion)
+            if is_on:
+                self._motion_mask |= bit
+                self._maybe_start_scan()
+            else:
+                self._motion_mask &= ~bit
+                self._maybe_stop_scan()
+            self._handle_motion_change(entity_id)
 
-        # Set up periodic scanning
-        self._cancel_scan_interval = async_track_time_interval(
+        self._unsub_motion = async_track_state_change_event(
             self.hass,
-            self._handle_interval_scan,
-            SCAN_INTERVAL
+            list(self._motion_sensors),
+            handle_motion,
         )
 
     async def async_unload(self) -> None:
         """Unload the manager."""
         if self._cancel_scan_interval is not None:
             self._cancel_scan_interval()
+            self._cancel_scan_interval = None
+
+        if self._unsub_motion is not None:
+            self._unsub_motion()
+            self._unsub_motion = None
 
         # Cancel any pending restore timers
-        for timer in self._restore_timers.values():
-            timer.cancel()
+        self._cancel_all_timers()
 
         self.hass.services.async_remove(DOMAIN, SERVICE_ADD_TIME_SLOT)
         self.hass.services.async_remove(DOMAIN, SERVICE_REMOVE_TIME_SLOT)
         self.hass.services.async_remove(DOMAIN, SERVICE_ENABLE)
         self.hass.services.async_remove(DOMAIN, SERVICE_DISABLE)
 
-    def _is_in_active_time_slot(self) -> bool:
-        """Check if current time is within any configured time slot."""
-        current_time = dt_util.now().time()
-        
+    @callback
+    def _cancel_all_timers(self) -> None:
+        """Cancel all pending restore timers and any debounced restore."""
+        timers, self._restore_timers = self._restore_timers, {}
+        for timer in timers.values():
+            timer.cancel()
+
+        if self._restore_pending is not None:
+            self._restore_pending()
+            self._restore_pending = None
+
+    @callback
+    def _maybe_start_scan(self) -> None:
+        """Start periodic scanning while enabled and motion is active."""
+        if (
+            self._cancel_scan_interval is None
+            and self._enabled
+            and self._motion_mask != 0
+        ):
+            self._cancel_scan_interval = async_track_time_interval(
+                self.hass,
+                self._handle_interval_scan,
+                SCAN_INTERVAL
+            )
+
+    @callback
+    def _maybe_stop_scan(self) -> None:
+        """Stop periodic scanning when there is nothing to check."""
+        if self._cancel_scan_interval is None:
+            return
+
+        if not self._enabled or self._motion_mask == 0:
+            self._cancel_scan_interval()
+            self._cancel_scan_interval = None
+
+    def _load_config(self) -> None:
+        """Snapshot the entry configuration used on hot paths."""
+        data = self.entry.data
+        self._lights = tuple(data[CONF_LIGHTS])
+        self._lights_payload = {"entity_id": list(self._lights)}
+        self._illuminance_sensors = tuple(
+            data.get(CONF_ILLUMINANCE_SENSORS) or ()
+        )
+        self._illuminance_threshold = data.get(
+            CONF_ILLUMINANCE_THRESHOLD,
+            DEFAULT_ILLUMINANCE_THRESHOLD
+        )
+        self._delay = data.get(CONF_DELAY, DEFAULT_DELAY)
+        self._last_illuminance_check = None
+        self._lux_cache = {}
+        self._rebuild_parsed_slots()
+
+    def _rebuild_parsed_slots(self) -> None:
+        """Parse the configured time slots once."""
+        parsed_slots: list[tuple[time, time]] = []
+
         for slot in self.entry.data.get(CONF_TIME_SLOTS, []):
             start = dt_util.parse_time(slot[CONF_START_TIME])
             end = dt_util.parse_time(slot[CONF_END_TIME])
-            
-            if start <= current_time <= end:
-                return True
-                
-        return False
+
+            if start is None or end is None:
+                _LOGGER.warning("Ignoring invalid time slot: %s", slot)
+                continue
+
+            if start <= end:
+                parsed_slots.append((start, end))
+            else:
+                # Split slots wrapping around midnight
+                parsed_slots.append((start, time.max))
+                parsed_slots.append((time.min, end))
+
+        # Merge overlapping slots so they can be binary searched
+        merged: list[list[time]] = []
+        for start, end in sorted(parsed_slots):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        self._slot_starts = [start for start, _ in merged]
+        self._slot_ends = [end for _, end in merged]
+
+    def _is_in_active_time_slot(self) -> bool:
+        """Check if current time is within any configured time slot."""
+        current_time = dt_util.now().time()
+        idx = bisect.bisect_right(self._slot_starts, current_time) - 1
+        return idx >= 0 and current_time <= self._slot_ends[idx]
 
     def _check_illuminance(self) -> bool:
         """Check if illuminance is below threshold."""
-        if not (sensors := self.entry.data.get(CONF_ILLUMINANCE_SENSORS)):
+        if not self._illuminance_sensors:
             return True
 
-        threshold = self.entry.data.get(
-            CONF_ILLUMINANCE_THRESHOLD,
-            DEFAULT_ILLUMINANCE_THRESHOLD
+        states = [
+            self.hass.states.get(sensor_id)
+            for sensor_id in self._illuminance_sensors
+        ]
+
+        # Reuse the previous answer if no sensor has updated since
+        fingerprint = tuple(
+            state.last_updated if state is not None else None
+            for state in states
         )
+        if fingerprint == self._last_illuminance_check:
+            return self._last_illuminance_result
 
-        for sensor_id in sensors:
-            state = self.hass.states.get(sensor_id)
+        self._last_illuminance_check = fingerprint
+        self._last_illuminance_result = self._evaluate_illuminance(states)
+        return self._last_illuminance_result
+
+    def _evaluate_illuminance(self, states: list[State | None]) -> bool:
+        """Check the given illuminance states against the threshold."""
+        threshold = self._illuminance_threshold
+
+        for sensor_id, state in zip(self._illuminance_sensors, states):
             if state is None:
                 continue
                 
-            try:
-                if float(state.state) > threshold:
-                    return False
-            except (ValueError, TypeError):
-                continue
+            cached = self._lux_cache.get(sensor_id)
+            if cached is not None and cached[0] == state.last_updated:
+                lux = cached[1]
+            else:
+                try:
+                    lux = float(state.state)
+                except (ValueError, TypeError):
+                    continue
+                self._lux_cache[sensor_id] = (state.last_updated, lux)
+
+            if lux > threshold:
+                return False
 
         return True
 
@@ -213,13 +352,10 @@ class LightStateRestorationManager:
         await self.hass.services.async_call(
             "light_state_management",
             "restore_state",
-            {
-                "entity_id": self.entry.data[CONF_LIGHTS]
-            },
-            blocking=True,
+            self._lights_payload,
         )
 
-        self.hass.bus.fire(
+        self.hass.bus.async_fire(
             EVENT_RESTORATION_TRIGGERED,
             {"area": self._area}
         )
@@ -229,46 +365,57 @@ class LightStateRestorationManager:
         if not self._enabled:
             return
 
-        if self._motion_active[motion_sensor_id]:
+        if self._motion_mask & (1 << self._motion_index[motion_sensor_id]):
             # Cancel any pending restore timer for this motion sensor
             if timer := self._restore_timers.pop(motion_sensor_id, None):
                 timer.cancel()
 
-            # Start restoration process
-            self.hass.async_create_task(self._restore_lights())
+            # Start restoration process, coalescing bursts from several sensors
+            if self._restore_pending is None:
+                self._restore_pending = async_call_later(
+                    self.hass,
+                    RESTORE_DEBOUNCE_DELAY,
+                    self._run_restore,
+                )
         else:
             # Start delay timer
-            delay = self.entry.data.get(CONF_DELAY, DEFAULT_DELAY)
+            delay = self._delay
             if delay > 0:
                 self._restore_timers[motion_sensor_id] = self.hass.async_create_task(
                     self._handle_delay_timer(motion_sensor_id, delay)
                 )
 
+    async def _run_restore(self, now: datetime) -> None:
+        """Run a debounced restoration."""
+        self._restore_pending = None
+        await self._restore_lights()
+
     async def _handle_delay_timer(
         self, motion_sensor_id: str, delay: int
     ) -> None:
         """Handle the delay timer for a motion sensor."""
+        timers = self._restore_timers
         try:
             await asyncio.sleep(delay)
             
             # If no motion is active, turn off lights
-            if not any(self._motion_active.values()):
-                for light_id in self.entry.data[CONF_LIGHTS]:
-                    await self.hass.services.async_call(
-                        "light",
-                        "turn_off",
-                        {"entity_id": light_id},
-                        blocking=True,
-                    )
-
-                self.hass.bus.fire(
+            if self._motion_mask == 0:
+                await self.hass.services.async_call(
+                    "light",
+                    "turn_off",
+                    self._lights_payload,
+                )
+
+                self.hass.bus.async_fire(
                     EVENT_RESTORATION_CANCELLED,
                     {"area": self._area}
                 )
         except asyncio.CancelledError:
             pass
         finally:
-            self._restore_timers.pop(motion_sensor_id, None)
+            # Timers cancelled in bulk have already been detached
+            if self._restore_timers is timers:
+                self._restore_timers.pop(motion_sensor_id, None)
 
     async def _handle_interval_scan(self, now: datetime) -> None:
         """Handle periodic scanning."""
@@ -279,7 +426,7 @@ class LightStateRestorationManager:
         if (
             self._is_in_active_time_slot()
             and self._check_illuminance()
-            and any(self._motion_active.values())
+            and self._motion_mask != 0
         ):
             await self._restore_lights()
 
@@ -290,18 +437,15 @@ class LightStateRestorationManager:
             CONF_END_TIME: call.data[CONF_END_TIME],
         }
         
-        time_slots = list(self.entry.data.get(CONF_TIME_SLOTS, []))
-        time_slots.append(new_slot)
-        
-        new_data = dict(self.entry.data)
-        new_data[CONF_TIME_SLOTS] = time_slots
+        time_slots = [*self.entry.data.get(CONF_TIME_SLOTS, ()), new_slot]
         
         self.hass.config_entries.async_update_entry(
             self.entry,
-            data=new_data
+            data={**self.entry.data, CONF_TIME_SLOTS: time_slots}
         )
+        self._load_config()
         
-        self.hass.bus.fire(
+        self.hass.bus.async_fire(
             EVENT_TIME_SLOT_ADDED,
             {"area": self._area, "slot": new_slot}
         )
@@ -313,21 +457,18 @@ class LightStateRestorationManager:
             CONF_END_TIME: call.data[CONF_END_TIME],
         }
         
-        time_slots = list(self.entry.data.get(CONF_TIME_SLOTS, []))
         time_slots = [
-            slot for slot in time_slots
+            slot for slot in self.entry.data.get(CONF_TIME_SLOTS, ())
             if slot != slot_to_remove
         ]
         
-        new_data = dict(self.entry.data)
-        new_data[CONF_TIME_SLOTS] = time_slots
-        
         self.hass.config_entries.async_update_entry(
             self.entry,
-            data=new_data
+            data={**self.entry.data, CONF_TIME_SLOTS: time_slots}
         )
+        self._load_config()
         
-        self.hass.bus.fire(
+        self.hass.bus.async_fire(
             EVENT_TIME_SLOT_REMOVED,
             {"area": self._area, "slot": slot_to_remove}
         )
@@ -337,18 +478,24 @@ class LightStateRestorationManager:
         if area := call.data.get(CONF_AREA):
             if area != self._area:
                 return
+
+        if self._enabled:
+            return
         
         self._enabled = True
+        self._maybe_start_scan()
 
     async def _handle_disable(self, call: ServiceCall) -> None:
         """Handle disable service call."""
         if area := call.data.get(CONF_AREA):
             if area != self._area:
                 return
+
+        if not self._enabled:
+            return
         
         self._enabled = False
+        self._maybe_stop_scan()
         
         # Cancel any pending restore timers
-        for timer in self._restore_timers.values():
-            timer.cancel()
-        self._restore_timers.clear() 
\ No newline at end of file
+        self._cancel_all_timers() 
\ No newline at end of file
@@ -44,4 +44,7 @@ EVENT_TIME_SLOT_ADDED = "time_slot_added"
 EVENT_TIME_SLOT_REMOVED = "time_slot_removed"
 
 # Scan interval
-SCAN_INTERVAL = timedelta(seconds=30) 
\ No newline at end of file
+SCAN_INTERVAL = timedelta(seconds=30)
+
+# Delay used to coalesce near-simultaneous motion triggers (seconds)
+RESTORE_DEBOUNCE_DELAY = 0.05 
\ No newline at end of file